@@ -0,0 +1,22 @@
+import os
+
+# 사용자 데이터 폴더 이름
+APP_NAME = 'WebTicketting'
+
+
+def data_dir():
+    """
+    색인/가격 데이터를 저장할 사용자 폴더
+
+    Windows는 %APPDATA%, 그 외는 $XDG_DATA_HOME (없으면 ~/.local/share) 아래를
+    사용한다. cx_Freeze로 빌드하면 모듈이 library.zip 안에 있으므로
+    모듈 위치나 실행 위치 대신 이 폴더를 쓴다.
+    """
+    base = (os.environ.get('APPDATA') or os.environ.get('XDG_DATA_HOME')
+            or os.path.join(os.path.expanduser('~'), '.local', 'share'))
+    return os.path.join(base, APP_NAME)
+
+
+def data_path(filename):
+    """사용자 데이터 폴더 안의 파일 경로 (폴더는 저장할 때 만든다)"""
+    return os.path.join(data_dir(), filename)
@@ -0,0 +1,227 @@
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+
+from app_paths import data_path
+from page_parser import extract_links_and_text, extract_title
+
+# 검색 결과 snippet에서 일치 부분 앞뒤에 들어가는 표시 문자
+HIGHLIGHT_START = '\x02'
+HIGHLIGHT_END = '\x03'
+
+# snippet에 포함할 일치 부분 앞뒤 글자 수
+SNIPPET_CHARS = 40
+
+# trigram 토크나이저는 3글자 미만 검색어를 MATCH로 찾을 수 없어 2글자 색인을 따로 사용
+MIN_MATCH_CHARS = 3
+
+# 2글자 색인에 넣을 단어 (unicode61 토크나이저가 나누는 '_'는 제외)
+WORD_PATTERN = re.compile(r'[^\W_]+')
+
+
+def bigram_text(text):
+    """
+    단어마다 겹치는 2글자 조각과 마지막 글자를 공백으로 이어 붙인 문자열
+
+    '좌석 가격' -> '좌석 석 가격 격'. 마지막 글자를 넣어두면 1글자 검색어도
+    접두어 검색('석*')으로 모든 위치를 찾을 수 있다.
+    """
+    tokens = []
+    for word in WORD_PATTERN.findall(text.lower()):
+        tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        tokens.append(word[-1])
+    return ' '.join(tokens)
+
+
+class PageIndex:
+    """필터링한 페이지 텍스트를 SQLite FTS5로 색인하고 검색하는 클래스"""
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): 색인 데이터베이스 파일 경로 (기본값은 사용자 데이터 폴더의 pages.db)
+        """
+        if path is None:
+            path = data_path('pages.db')
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Flask처럼 여러 스레드에서 호출될 수 있으므로 연결 하나를 잠금으로 보호
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.setup_tables()
+
+    def setup_tables(self):
+        """색인 테이블 생성"""
+        with self.lock, self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS documents (
+                    id INTEGER PRIMARY KEY,
+                    url TEXT UNIQUE NOT NULL,
+                    title TEXT NOT NULL,
+                    saved_at TEXT NOT NULL
+                )
+            """)
+            # 띄어쓰기 단위로 나누기 어려운 한국어도 부분 문자열로 찾을 수 있도록
+            # trigram 토크나이저 사용 (SQLite 3.34 미만이면 unicode61 사용)
+            try:
+                self.conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS pages "
+                    "USING fts5(title, body, tokenize='trigram')")
+            except sqlite3.OperationalError:
+                self.conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS pages "
+                    "USING fts5(title, body, tokenize='unicode61')")
+            sql = self.conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'pages'").fetchone()[0]
+            self.trigram = 'trigram' in sql
+
+            # 2글자 이하 검색어용 색인 (bigram_text로 나눈 조각을 저장)
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS page_bigrams "
+                "USING fts5(title, body, tokenize='unicode61')")
+
+    def add_text(self, url, text, title=''):
+        """
+        페이지 텍스트를 색인에 추가 (같은 URL은 새 내용으로 교체)
+
+        Args:
+            url (str): 페이지 주소
+            text (str): 페이지 텍스트
+            title (str): 페이지 제목
+        """
+        saved_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO documents (url, title, saved_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET title = excluded.title, "
+                "saved_at = excluded.saved_at",
+                (url, title, saved_at))
+            doc_id = self.conn.execute(
+                "SELECT id FROM documents WHERE url = ?", (url,)).fetchone()[0]
+            self.conn.execute("DELETE FROM pages WHERE rowid = ?", (doc_id,))
+            self.conn.execute("DELETE FROM page_bigrams WHERE rowid = ?", (doc_id,))
+            self.conn.execute(
+                "INSERT INTO pages (rowid, title, body) VALUES (?, ?, ?)",
+                (doc_id, title, text))
+            self.conn.execute(
+                "INSERT INTO page_bigrams (rowid, title, body) VALUES (?, ?, ?)",
+                (doc_id, bigram_text(title), bigram_text(text)))
+
+    def add_page(self, url, html_content, title='', encoding=None):
+        """
+        HTML 페이지의 텍스트를 추출해서 색인에 추가
+
+        Args:
+            url (str): 페이지 주소
+            html_content (str | bytes): HTML 문서
+            title (str): 페이지 제목 (없으면 문서의 <title> 사용)
+            encoding (str): html_content가 bytes일 때 사용할 인코딩
+        """
+        _, text = extract_links_and_text(html_content, encoding, max_links=0)
+        if not title:
+            title = extract_title(html_content, encoding)
+        self.add_text(url, text.strip(), title)
+
+    def remove(self, url):
+        """색인에서 페이지 삭제"""
+        with self.lock, self.conn:
+            row = self.conn.execute(
+                "SELECT id FROM documents WHERE url = ?", (url,)).fetchone()
+            if row:
+                self.conn.execute("DELETE FROM pages WHERE rowid = ?", row)
+                self.conn.execute("DELETE FROM page_bigrams WHERE rowid = ?", row)
+                self.conn.execute("DELETE FROM documents WHERE id = ?", row)
+
+    def search(self, query, limit=20):
+        """
+        색인된 페이지 검색
+
+        검색어는 공백으로 나눈 모든 단어를 포함하는 페이지를 찾으며,
+        FTS 순위(bm25) 순으로 정렬한다. 3글자 이상 단어는 trigram 색인,
+        더 짧은 단어는 2글자 색인에서 찾는다. snippet의 일치 부분은
+        HIGHLIGHT_START / HIGHLIGHT_END로 감싸서 반환한다.
+
+        Args:
+            query (str): 검색어
+            limit (int): 최대 결과 수
+        """
+        terms = query.split()
+        min_chars = MIN_MATCH_CHARS if self.trigram else 1
+        match_terms = [term for term in terms if len(term) >= min_chars]
+        short_terms = [term for term in terms if len(term) < min_chars]
+        short_query = ' '.join(filter(None, map(self.bigram_query, short_terms)))
+        if not match_terms and not short_query:
+            return []
+
+        if match_terms:
+            sql = (
+                "SELECT d.url, d.title, d.saved_at, "
+                "snippet(pages, 1, ?, ?, '…', ?), pages.rank "
+                "FROM pages JOIN documents d ON d.id = pages.rowid ")
+            conditions = "WHERE pages MATCH ?"
+            params = [HIGHLIGHT_START, HIGHLIGHT_END, SNIPPET_CHARS,
+                      ' '.join(self.quote_term(term) for term in match_terms)]
+            if short_query:
+                # IN (서브쿼리)로 쓰면 행마다 서브쿼리를 다시 실행하므로 rowid로 조인
+                sql += "JOIN page_bigrams ON page_bigrams.rowid = pages.rowid "
+                conditions += " AND page_bigrams MATCH ?"
+                params.append(short_query)
+            sql += conditions + " ORDER BY pages.rank LIMIT ?"
+        else:
+            sql = (
+                "SELECT d.url, d.title, d.saved_at, pages.body, page_bigrams.rank "
+                "FROM page_bigrams JOIN documents d ON d.id = page_bigrams.rowid "
+                "JOIN pages ON pages.rowid = page_bigrams.rowid "
+                "WHERE page_bigrams MATCH ? ORDER BY page_bigrams.rank LIMIT ?")
+            params = [short_query]
+        params.append(limit)
+
+        try:
+            with self.lock:
+                rows = self.conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            # 검색식 문법 오류만 결과 없음으로 처리 (잠금 등 실제 오류는 그대로 전달)
+            if 'fts5: syntax error' in str(e):
+                return []
+            raise
+
+        results = []
+        for url, title, saved_at, snippet, rank in rows:
+            if not match_terms:
+                snippet = self.make_snippet(snippet, short_terms[0])
+            results.append({
+                'url': url,
+                'title': title,
+                'saved_at': saved_at,
+                'snippet': snippet,
+                'rank': rank
+            })
+        return results
+
+    def bigram_query(self, term):
+        """짧은 검색어를 2글자 색인용 FTS5 검색식으로 변환"""
+        parts = []
+        for word in WORD_PATTERN.findall(term.lower()):
+            # 1글자는 그 글자로 시작하는 조각 모두 (단어 끝 글자 포함)
+            parts.append(self.quote_term(word) + ('*' if len(word) == 1 else ''))
+        return ' '.join(parts)
+
+    def quote_term(self, term):
+        """FTS5 문법 문자가 섞인 검색어를 문자열 그대로 찾도록 감싸기"""
+        return '"' + term.replace('"', '""') + '"'
+
+    def make_snippet(self, text, term):
+        """본문에서 term이 처음 나오는 부분 주변을 잘라서 반환"""
+        position = text.lower().find(term.lower())
+        if position < 0:
+            return text[:SNIPPET_CHARS * 2]
+        start = max(position - SNIPPET_CHARS, 0)
+        end = position + len(term)
+        return ('…' if start else '') + text[start:position] + HIGHLIGHT_START + \
+            text[position:end] + HIGHLIGHT_END + text[end:end + SNIPPET_CHARS] + \
+            ('…' if end + SNIPPET_CHARS < len(text) else '')
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,320 @@
+import codecs
+import itertools
+import re
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+from bs4 import BeautifulSoup
+import soupsieve as sv
+
+# 공연 목록/좌석 정보 영역 안에서 사용하는 하위 선택자 (import 시 한 번만 컴파일)
+CONCERT_TITLE_SELECTOR = sv.compile('.RKthumb > a')
+CONCERT_PLACE_SELECTOR = sv.compile('.RKplace')
+SEAT_GRADE_SELECTOR = sv.compile('.GradeType')
+SEAT_PRICE_SELECTOR = sv.compile('.Price')
+
+# 닫는 태그가 없는 요소 (열린 태그 스택에 쌓지 않음)
+VOID_ELEMENTS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+})
+
+# 텍스트로 취급하지 않는 요소 (BeautifulSoup의 get_text와 동일하게 제외)
+NON_TEXT_ELEMENTS = frozenset({'script', 'style', 'template'})
+
+# 한 번에 파서에 넣는 문자(바이트) 수
+CHUNK_SIZE = 8192
+
+# <meta charset>을 찾을 문서 앞부분 크기
+META_SCAN_SIZE = 1024
+
+CHARSET_HEADER_PATTERN = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.I)
+META_CHARSET_PATTERN = re.compile(
+    rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.I)
+
+BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# codecs.lookup()이 돌려주는 코덱 이름 기준 대체 인코딩
+# (EUC-KR/KS C 5601로 선언된 페이지도 실제로는 CP949 확장 문자를 쓰는 경우가 많음)
+ENCODING_ALIASES = {
+    'euc_kr': 'cp949',
+    'iso8859-1': 'cp1252',
+}
+
+# 호스트별로 확인된 인코딩 (전체 본문 감지를 반복하지 않기 위함)
+HOST_ENCODINGS = {}
+
+
+def normalize_encoding(name):
+    """인코딩 이름을 파이썬 코덱 이름으로 변환 (알 수 없으면 None)"""
+    if isinstance(name, bytes):
+        name = name.decode('ascii', 'ignore')
+    try:
+        codec = codecs.lookup(name.strip()).name
+    except LookupError:
+        return None
+    return ENCODING_ALIASES.get(codec, codec)
+
+
+def resolve_encoding(response):
+    """
+    응답 본문의 인코딩 결정
+
+    BOM, HTTP 헤더, 앞부분 1KB의 <meta charset> 순으로 확인하고
+    (WHATWG 인코딩 판별 순서), 모두 없으면 같은 호스트에서 확인했던
+    인코딩을 사용한다. 전체 본문 통계 감지는 마지막 수단으로만 실행한다.
+
+    Args:
+        response (requests.Response): 요청 결과
+    """
+    host = urlsplit(response.url).hostname
+    head = response.content[:META_SCAN_SIZE]
+    encoding = None
+    for bom, bom_encoding in BOMS:
+        if head.startswith(bom):
+            encoding = bom_encoding
+            break
+
+    if not encoding:
+        content_type = response.headers.get('Content-Type', '')
+        match = CHARSET_HEADER_PATTERN.search(content_type)
+        encoding = match and normalize_encoding(match.group(1))
+    if not encoding:
+        match = META_CHARSET_PATTERN.search(head)
+        encoding = match and normalize_encoding(match.group(1))
+    if not encoding:
+        encoding = HOST_ENCODINGS.get(host)
+    if not encoding:
+        encoding = normalize_encoding(response.apparent_encoding or 'utf-8')
+    HOST_ENCODINGS[host] = encoding
+    return encoding
+
+
+def iter_chunks(markup, encoding=None):
+    """
+    마크업을 CHUNK_SIZE 단위로 나눠서 반환
+
+    bytes가 주어지면 필요한 부분만 순서대로 디코딩한다.
+    """
+    if isinstance(markup, str):
+        for start in range(0, len(markup), CHUNK_SIZE):
+            yield markup[start:start + CHUNK_SIZE]
+        return
+    decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+    for start in range(0, len(markup), CHUNK_SIZE):
+        yield decoder.decode(markup[start:start + CHUNK_SIZE])
+    yield decoder.decode(b'', final=True)
+
+
+class RegionMatcher(HTMLParser):
+    """태그 이름/클래스가 일치하는 요소의 마크업만 모으는 스트리밍 파서"""
+
+    def __init__(self, name=None, class_=None):
+        super().__init__(convert_charrefs=False)
+        self.name = name
+        self.class_ = class_
+        self.stack = []
+        self.fragments = []
+        self.parts = None
+        self.match_depth = None
+
+    def matches(self, tag, attrs):
+        if self.name and tag != self.name:
+            return False
+        if self.class_:
+            classes = (dict(attrs).get('class') or '').split()
+            if self.class_ not in classes:
+                return False
+        return True
+
+    def handle_starttag(self, tag, attrs):
+        if self.parts is None and self.matches(tag, attrs):
+            self.match_depth = len(self.stack)
+            self.parts = []
+        if self.parts is not None:
+            self.parts.append(self.get_starttag_text())
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(tag)
+        elif self.match_depth == len(self.stack):
+            self.finish_fragment()
+
+    def handle_startendtag(self, tag, attrs):
+        if self.parts is None and self.matches(tag, attrs):
+            self.fragments.append(self.get_starttag_text())
+            return
+        if self.parts is not None:
+            self.parts.append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if tag not in self.stack:
+            return
+        if self.parts is not None:
+            self.parts.append(f'</{tag}>')
+        # 닫히지 않은 하위 요소까지 함께 닫는다
+        while self.stack.pop() != tag:
+            pass
+        if self.match_depth is not None and len(self.stack) <= self.match_depth:
+            self.finish_fragment()
+
+    def handle_data(self, data):
+        if self.parts is not None:
+            self.parts.append(data)
+
+    def handle_entityref(self, name):
+        self.handle_data(f'&{name};')
+
+    def handle_charref(self, name):
+        self.handle_data(f'&#{name};')
+
+    def finish_fragment(self):
+        self.fragments.append(''.join(self.parts))
+        self.parts = None
+        self.match_depth = None
+
+    def run(self, markup, encoding=None):
+        """마크업을 나눠서 파싱하고 일치 요소의 마크업 목록 반환"""
+        for chunk in iter_chunks(markup, encoding):
+            self.feed(chunk)
+        self.close()
+        # 문서가 중간에 끝난 경우 모은 부분까지만 사용
+        if self.parts is not None:
+            self.finish_fragment()
+        return self.fragments
+
+
+class LinkTextCollector(HTMLParser):
+    """트리를 만들지 않고 링크(href)와 본문 텍스트를 문서 순서대로 모으는 파서"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.events = []  # ('link', href) 또는 ('text', 문자열)
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        self.handle_link(tag, attrs)
+        if tag in NON_TEXT_ELEMENTS:
+            self.skip_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_link(tag, attrs)
+
+    def handle_link(self, tag, attrs):
+        if tag == 'a':
+            attrs = dict(attrs)
+            if 'href' in attrs:
+                self.events.append(('link', attrs['href'] or ''))
+
+    def handle_endtag(self, tag):
+        if tag in NON_TEXT_ELEMENTS and self.skip_depth:
+            self.skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.events.append(('text', data))
+
+    def pop_events(self):
+        events = self.events
+        self.events = []
+        return events
+
+
+def select_regions(markup, name=None, class_=None, encoding=None):
+    """
+    일치하는 요소들만 BeautifulSoup 트리로 만들어 반환
+
+    Args:
+        markup (str | bytes): HTML 문서
+        name (str): 찾을 태그 이름
+        class_ (str): 찾을 클래스 이름
+        encoding (str): markup이 bytes일 때 사용할 인코딩
+    """
+    matcher = RegionMatcher(name, class_)
+    fragments = matcher.run(markup, encoding)
+    if not fragments:
+        return []
+    soup = BeautifulSoup(''.join(fragments), 'html.parser')
+    # 닫히지 않은 요소 안에 중첩된 일치 요소도 기존 select()처럼 포함
+    attrs = {'class_': class_} if class_ else {}
+    return soup.find_all(name or True, **attrs)
+
+
+def extract_title(markup, encoding=None):
+    """
+    문서의 <title> 텍스트 (없으면 빈 문자열)
+
+    Args:
+        markup (str | bytes): HTML 문서
+        encoding (str): markup이 bytes일 때 사용할 인코딩
+    """
+    titles = select_regions(markup, name='title', encoding=encoding)
+    return titles[0].get_text().strip() if titles else ''
+
+
+def iter_page_content(markup, encoding=None, max_links=None, max_chars=None):
+    """
+    페이지의 링크와 텍스트를 문서 순서대로 반환하는 제너레이터
+
+    ('link', href) 또는 ('text', 문자열) 튜플을 반환하며, 문서 앞쪽의
+    공백은 건너뛴다. 요청한 링크 수와 글자 수를 모두 채우면 남은 문서는
+    파싱하지 않는다.
+
+    Args:
+        markup (str | bytes): HTML 문서
+        encoding (str): markup이 bytes일 때 사용할 인코딩
+        max_links (int): 최대 링크 수 (None이면 제한 없음, 0이면 링크 제외)
+        max_chars (int): 최대 글자 수 (None이면 제한 없음, 0이면 텍스트 제외)
+    """
+    collector = LinkTextCollector()
+    links_left = max_links
+    chars_left = max_chars
+    text_started = False
+    # 마지막에 None을 넣어 남은 버퍼를 close()로 처리
+    for chunk in itertools.chain(iter_chunks(markup, encoding), [None]):
+        if chunk is None:
+            collector.close()
+        else:
+            collector.feed(chunk)
+        for kind, value in collector.pop_events():
+            if kind == 'link':
+                if links_left == 0:
+                    continue
+                if links_left is not None:
+                    links_left -= 1
+            else:
+                if chars_left == 0:
+                    continue
+                if not text_started:
+                    value = value.lstrip()
+                    if not value:
+                        continue
+                    text_started = True
+                if chars_left is not None:
+                    value = value[:chars_left]
+                    chars_left -= len(value)
+            yield kind, value
+            if links_left == 0 and chars_left == 0:
+                return
+
+
+def extract_links_and_text(markup, encoding=None, max_links=None, max_chars=None):
+    """
+    페이지의 링크 목록과 텍스트 추출
+
+    Args:
+        markup (str | bytes): HTML 문서
+        encoding (str): markup이 bytes일 때 사용할 인코딩
+        max_links (int): 최대 링크 수 (None이면 제한 없음)
+        max_chars (int): 최대 글자 수 (None이면 제한 없음)
+    """
+    links = []
+    texts = []
+    for kind, value in iter_page_content(markup, encoding, max_links, max_chars):
+        if kind == 'link':
+            links.append(value)
+        else:
+            texts.append(value)
+    return links, ''.join(texts)
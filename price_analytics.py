@@ -0,0 +1,166 @@
+import os
+import re
+
+import numpy as np
+
+# '110,000원', 'R석 99,000' 같은 문자열에서 숫자 부분
+PRICE_PATTERN = re.compile(r'\d[\d,]*(?:\.\d+)?')
+# '원'이 붙은 숫자 ('1층 150,000원'에서 층수 대신 가격을 고르기 위함)
+WON_PATTERN = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*원')
+
+# summary()에서 묶을 수 있는 열
+GROUP_COLUMNS = ('grade', 'venue', 'concert', 'date')
+
+
+def parse_price(text):
+    """
+    가격 문자열을 숫자로 변환 (숫자가 없으면 NaN)
+
+    '원'이 붙은 마지막 숫자를 쓰고, 없으면 가장 큰 숫자를 가격으로 본다.
+    """
+    text = text or ''
+    numbers = WON_PATTERN.findall(text)
+    if numbers:
+        return float(numbers[-1].replace(',', ''))
+    numbers = [float(number.replace(',', '')) for number in PRICE_PATTERN.findall(text)]
+    return max(numbers) if numbers else np.nan
+
+
+def to_date(date_str):
+    """'yyyyMMdd' 또는 'yyyy-MM-dd' 문자열을 numpy 날짜로 변환"""
+    if len(date_str) == 8 and date_str.isdigit():
+        date_str = f'{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}'
+    return np.datetime64(date_str, 'D')
+
+
+class SeatPriceStore:
+    """수집한 좌석 등급별 가격을 열 단위 배열로 저장하고 집계하는 클래스"""
+
+    def __init__(self):
+        self.columns = {
+            'date': np.empty(0, dtype='datetime64[D]'),
+            'concert': np.empty(0, dtype=str),
+            'venue': np.empty(0, dtype=str),
+            'grade': np.empty(0, dtype=str),
+            'price': np.empty(0, dtype=float)
+        }
+        self.pending = []       # 아직 배열에 합치지 않은 (날짜, 공연 코드, 공연장, 등급, 가격)
+        self.pending_keys = set()
+
+    def __len__(self):
+        return len(self.columns['price']) + len(self.pending)
+
+    def add_concert(self, date_str, code, seats, venue=''):
+        """
+        공연 하나의 좌석 등급별 가격 추가
+
+        같은 날짜/공연 코드로 다시 추가하면 이전에 저장된 가격을 대체한다.
+        좌석 정보가 비어 있으면 (가져오기 실패 포함) 기존 가격을 그대로 둔다.
+
+        Args:
+            date_str (str): 공연 날짜 (yyyyMMdd)
+            code (str): 공연 코드
+            seats (dict): 좌석 등급 -> 가격 문자열
+            venue (str): 공연장
+        """
+        if not seats:
+            return
+        date = to_date(date_str)
+        key = (str(date), code)
+        # 같은 배치 안에서 다시 추가된 경우 먼저 들어온 행은 버린다
+        if key in self.pending_keys:
+            self.pending = [row for row in self.pending
+                            if (str(row[0]), row[1]) != key]
+        self.pending_keys.add(key)
+        for grade, price in seats.items():
+            self.pending.append((date, code, venue, grade, parse_price(price)))
+
+    def flush(self):
+        """추가 대기 중인 행을 배열에 합치기"""
+        if not self.pending_keys:
+            return
+        if len(self.columns['price']):
+            # 다시 수집한 날짜/공연의 이전 행 제거
+            keys = np.char.add(np.char.add(self.columns['date'].astype(str), '|'),
+                               self.columns['concert'])
+            stale = np.isin(keys, ['|'.join(key) for key in self.pending_keys])
+            if stale.any():
+                self.columns = {name: values[~stale]
+                                for name, values in self.columns.items()}
+        if self.pending:
+            dates, concerts, venues, grades, prices = zip(*self.pending)
+            new_columns = {
+                'date': np.array(dates, dtype='datetime64[D]'),
+                'concert': np.array(concerts, dtype=str),
+                'venue': np.array(venues, dtype=str),
+                'grade': np.array(grades, dtype=str),
+                'price': np.array(prices, dtype=float)
+            }
+            self.columns = {name: np.concatenate([values, new_columns[name]])
+                            for name, values in self.columns.items()}
+        self.pending = []
+        self.pending_keys = set()
+
+    def summary(self, by='grade', start=None, end=None):
+        """
+        열(by) 값별 가격 통계
+
+        Args:
+            by (str): 묶을 열 ('grade', 'venue', 'concert', 'date')
+            start (str): 집계 시작 날짜 (yyyyMMdd, 포함)
+            end (str): 집계 끝 날짜 (yyyyMMdd, 포함)
+
+        Returns:
+            dict: key, count, min, median, max, mean 배열
+        """
+        if by not in GROUP_COLUMNS:
+            raise ValueError(f"지원하지 않는 집계 기준: {by}")
+        self.flush()
+
+        prices = self.columns['price']
+        mask = ~np.isnan(prices)
+        if start:
+            mask &= self.columns['date'] >= to_date(start)
+        if end:
+            mask &= self.columns['date'] <= to_date(end)
+        prices = prices[mask]
+        values = self.columns[by][mask]
+
+        if not prices.size:
+            empty = np.empty(0, dtype=float)
+            return {'key': values, 'count': np.empty(0, dtype=int),
+                    'min': empty, 'median': empty, 'max': empty, 'mean': empty}
+
+        # 그룹 번호와 가격으로 정렬하면 그룹별 최소/최대/중앙값을 위치로 바로 구할 수 있다
+        keys, groups = np.unique(values, return_inverse=True)
+        order = np.lexsort((prices, groups))
+        prices = prices[order]
+        groups = groups[order]
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+        counts = np.diff(np.r_[starts, prices.size])
+        lower = starts + (counts - 1) // 2
+        upper = starts + counts // 2
+
+        return {
+            'key': keys,
+            'count': counts,
+            'min': prices[starts],
+            'median': (prices[lower] + prices[upper]) / 2,
+            'max': prices[starts + counts - 1],
+            'mean': np.add.reduceat(prices, starts) / counts
+        }
+
+    def save(self, path):
+        """수집한 가격 데이터를 .npz 파일로 저장"""
+        self.flush()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        np.savez(path, **self.columns)
+
+    def load(self, path):
+        """저장된 가격 데이터 불러오기 (파일이 없으면 무시)"""
+        if not os.path.exists(path):
+            return
+        with np.load(path) as data:
+            self.columns = {name: data[name] for name in self.columns}
+        self.pending = []
+        self.pending_keys = set()
@@ -2,10 +2,11 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
+from page_parser import extract_links_and_text
+from page_index import PageIndex
 import time
 
-def get_links_from_dynamic_page_without_media(url):
+def get_links_from_dynamic_page_without_media(url, max_links=None, max_chars=None, index=None):
     # ChromeOptions 설정
     chrome_options = Options()
     chrome_options.add_argument("--headless")  # 브라우저 창을 띄우지 않음
@@ -27,15 +28,18 @@ def get_links_from_dynamic_page_without_media(url):
 
         # 완전히 로드된 HTML 가져오기
         page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
         
-        # 링크 추출
-        links = [a['href'] for a in soup.find_all('a', href=True)]
+        # 링크와 페이지 텍스트 추출 (제한을 채우면 파싱 중단)
+        links, page_text = extract_links_and_text(
+            page_source, max_links=max_links, max_chars=max_chars)
         
-        # 페이지 텍스트 추출
-        page_text = soup.get_text()
+        page_text = page_text.strip()
         
-        return links, page_text.strip()
+        # 전체 텍스트를 가져온 경우 전문 검색 색인에 추가
+        if index is not None and max_chars is None:
+            index.add_text(url, page_text)
+        
+        return links, page_text
     
     finally:
         # WebDriver 종료
@@ -43,7 +47,7 @@ def get_links_from_dynamic_page_without_media(url):
 
 # 테스트
 url = "https://example.com"
-links, text = get_links_from_dynamic_page_without_media(url)
+links, text = get_links_from_dynamic_page_without_media(url, index=PageIndex())
 
 print("Links:")
 for link in links:
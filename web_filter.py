@@ -9,9 +9,11 @@ from bs4 import BeautifulSoup
 import tkinter as tk
 from tkinter import messagebox
 import os
+import sqlite3
 import webbrowser
 from datetime import datetime
 from webdriver_manager.chrome import ChromeDriverManager
+from page_index import PageIndex
 
 class WebContentFilter:
     def __init__(self):
@@ -140,6 +142,7 @@ class FilterApp:
                  bg='#0066cc', fg='white', padx=20, pady=5).pack()
         
         self.filter = WebContentFilter()
+        self.index = None  # 처음 색인할 때 연다 (실패해도 필터링/저장은 계속 동작)
 
     def process_url(self):
         self.status_label.config(text="페이지 로딩 중...")
@@ -162,7 +165,15 @@ class FilterApp:
             filtered_content = self.filter.filter_content(html_content, url)
             saved_file = self.filter.save_and_open(filtered_content)
             
-            self.status_label.config(text="")
+            # 색인 실패(다른 프로세스가 잠근 경우 등)는 저장 결과에 영향을 주지 않음
+            try:
+                if self.index is None:
+                    self.index = PageIndex()
+                self.index.add_page(url, filtered_content)
+                self.status_label.config(text="")
+            except (sqlite3.Error, OSError) as e:
+                self.status_label.config(text=f"검색 색인 추가 실패: {e}")
+            
             if saved_file:
                 messagebox.showinfo("Success", f"파일이 저장되었습니다:\n{saved_file}")
 
@@ -1,20 +1,25 @@
-from flask import Flask, render_template_string
+from flask import Flask, render_template_string, request
+from markupsafe import Markup, escape
 import requests
-from bs4 import BeautifulSoup
+from page_parser import extract_links_and_text, resolve_encoding
+from page_index import PageIndex, HIGHLIGHT_START, HIGHLIGHT_END
 
 app = Flask(__name__)
 
-def get_links_from_page(url):
+# 미리보기에 표시할 최대 글자 수
+PREVIEW_CHARS = 1000
+
+# FilterApp이 필터링한 페이지의 전문 검색 색인 (검색만 수행)
+page_index = PageIndex()
+
+def get_links_from_page(url, max_links=None, max_chars=None):
     try:
         response = requests.get(url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # 링크 추출
-        links = [a['href'] for a in soup.find_all('a', href=True)]
         
-        # 텍스트 추출
-        page_text = soup.get_text()
+        # 트리를 만들지 않고 링크와 텍스트만 추출 (제한을 채우면 파싱 중단)
+        links, page_text = extract_links_and_text(
+            response.content, resolve_encoding(response), max_links, max_chars)
         
         return links, page_text.strip()
     except requests.RequestException as e:
@@ -23,7 +28,7 @@ def get_links_from_page(url):
 @app.route('/')
 def home():
     url = "https://www.interpark.com/"  # 여기에 원하는 URL 입력
-    links, text = get_links_from_page(url)
+    links, text = get_links_from_page(url, max_chars=PREVIEW_CHARS)
     
     # HTML 템플릿
     html_template = """
@@ -46,7 +51,47 @@ def home():
     """
     
     # HTML 렌더링
-    return render_template_string(html_template, links=links, text=text[:1000])  # 텍스트는 처음 1000자만 표시
+    return render_template_string(html_template, links=links, text=text)
+
+@app.route('/search')
+def search():
+    query = request.args.get('q', '').strip()
+    results = page_index.search(query) if query else []
+    
+    # snippet은 이스케이프한 뒤 일치 부분만 강조 표시
+    for result in results:
+        snippet = str(escape(result['snippet']))
+        result['snippet'] = Markup(snippet.replace(HIGHLIGHT_START, '<mark>')
+                                          .replace(HIGHLIGHT_END, '</mark>'))
+    
+    html_template = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Search Saved Pages</title>
+    </head>
+    <body>
+        <form action="/search">
+            <input type="text" name="q" value="{{ query }}">
+            <button type="submit">Search</button>
+        </form>
+        {% if query %}
+            <h1>{{ results|length }} results for "{{ query }}"</h1>
+        {% endif %}
+        <ol>
+            {% for result in results %}
+                <li>
+                    <a href="{{ result.url }}" target="_blank">{{ result.title or result.url }}</a>
+                    <small>{{ result.saved_at }}</small>
+                    <p>{{ result.snippet }}</p>
+                </li>
+            {% endfor %}
+        </ol>
+    </body>
+    </html>
+    """
+    
+    return render_template_string(html_template, query=query, results=results)
 
 if __name__ == '__main__':
     app.run(debug=True)
@@ -1,8 +1,9 @@
 import sys
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QHBoxLayout, QLabel, QLineEdit, QPushButton, 
-                           QCalendarWidget, QComboBox, QTextEdit, QMessageBox)
-from PyQt5.QtCore import QDate
+                           QCalendarWidget, QComboBox, QTextEdit, QMessageBox,
+                           QTableWidget, QTableWidgetItem)
+from PyQt5.QtCore import QDate, Qt, QAbstractListModel, QModelIndex
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -11,14 +12,145 @@ from selenium.common.exceptions import TimeoutException
 import datetime
 import logging
 import requests
-from bs4 import BeautifulSoup
+from page_parser import (select_regions, resolve_encoding, CONCERT_TITLE_SELECTOR,
+                         CONCERT_PLACE_SELECTOR, SEAT_GRADE_SELECTOR, SEAT_PRICE_SELECTOR)
+from price_analytics import SeatPriceStore
+from app_paths import data_path
+
+# 공연 목록을 모델에 한 번에 추가하는 단위
+CONCERT_BATCH_SIZE = 50
+
+# 수집한 좌석 가격 데이터 파일 (검색 색인과 같은 사용자 데이터 폴더)
+PRICE_STORE_PATH = data_path('seat_prices.npz')
+
+class ConcertListModel(QAbstractListModel):
+    """공연 코드 기준으로 공연 목록을 관리하고 제목으로 필터링하는 모델"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.concerts = {}     # 공연 코드 -> 공연 정보
+        self.positions = {}    # 공연 코드 -> 추가된 순서
+        self.titles = {}       # 공연 코드 -> 소문자 제목
+        self.ngrams = {}       # 제목의 1/2글자 조각 -> 공연 코드 집합
+        self.visible = []      # 현재 필터를 통과한 공연 코드
+        self.rows = {}         # 공연 코드 -> visible에서의 행 번호
+        self.filter_text = ''
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.visible)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        concert = self.concerts[self.visible[index.row()]]
+        if role == Qt.DisplayRole:
+            return concert['title']
+        if role in (Qt.UserRole, Qt.ToolTipRole):
+            return concert['code']
+        return None
+
+    def title_ngrams(self, title):
+        grams = set(title)
+        grams.update(title[i:i + 2] for i in range(len(title) - 1))
+        return grams
+
+    def index_title(self, code, title):
+        self.titles[code] = title.lower()
+        for gram in self.title_ngrams(self.titles[code]):
+            self.ngrams.setdefault(gram, set()).add(code)
+
+    def unindex_title(self, code):
+        for gram in self.title_ngrams(self.titles.pop(code)):
+            codes = self.ngrams.get(gram)
+            if codes:
+                codes.discard(code)
+
+    def clear(self):
+        """모든 공연 정보 삭제"""
+        self.beginResetModel()
+        self.concerts = {}
+        self.positions = {}
+        self.titles = {}
+        self.ngrams = {}
+        self.visible = []
+        self.rows = {}
+        self.endResetModel()
+
+    def add_concerts(self, concerts):
+        """
+        공연 목록을 한 번에 추가 (이미 있는 공연 코드는 정보만 갱신)
+
+        Args:
+            concerts (list): {'title', 'code', 'seats'} 형태의 공연 정보 목록
+        """
+        added = []
+        updated = False
+        for concert in concerts:
+            code = concert['code']
+            if code in self.concerts:
+                self.unindex_title(code)
+                updated = True
+            else:
+                self.positions[code] = len(self.positions)
+                added.append(code)
+            self.concerts[code] = concert
+            self.index_title(code, concert['title'])
+
+        # 필터 중에는 앞부분 일치 우선 순서를 지키기 위해 목록 전체를 다시 계산
+        if updated or self.filter_text:
+            self.set_filter(self.filter_text)
+            return
+
+        if added:
+            start = len(self.visible)
+            self.beginInsertRows(QModelIndex(), start, start + len(added) - 1)
+            self.visible.extend(added)
+            self.rows.update((code, start + i) for i, code in enumerate(added))
+            self.endInsertRows()
+
+    def row_of(self, code):
+        """현재 목록에서 공연 코드의 행 번호 (없으면 None)"""
+        return self.rows.get(code)
+
+    def matching_codes(self, query):
+        """제목에 query가 포함된 공연 코드 (앞부분 일치 우선, 추가 순서)"""
+        if not query:
+            return sorted(self.concerts, key=self.positions.get)
+        if len(query) == 1:
+            candidates = self.ngrams.get(query, set())
+        else:
+            grams = [query[i:i + 2] for i in range(len(query) - 1)]
+            sets = sorted((self.ngrams.get(gram, set()) for gram in grams), key=len)
+            candidates = set.intersection(*sets)
+        # 2글자 조각이 모두 있어도 연속하지 않을 수 있으므로 한 번 더 확인
+        matches = [code for code in candidates if query in self.titles[code]]
+        matches.sort(key=lambda code: (not self.titles[code].startswith(query),
+                                       self.positions[code]))
+        return matches
+
+    def set_filter(self, text):
+        """
+        제목 검색어로 표시할 공연 목록 갱신
+
+        Args:
+            text (str): 검색어 (대소문자 구분 없음)
+        """
+        self.filter_text = text.strip()
+        self.beginResetModel()
+        self.visible = self.matching_codes(self.filter_text.lower())
+        self.rows = {code: row for row, code in enumerate(self.visible)}
+        self.endResetModel()
 
 class TicketingApp(QMainWindow):
     def __init__(self):
         super().__init__()
+        self.price_store = SeatPriceStore()  # 날짜/공연별 좌석 가격
         self.initUI()
         self.setup_logging()
-        self.concert_data = {}  # 콘서트 정보를 저장할 딕셔너리
+        self.load_price_store()
+        self.update_price_stats()
 
     def setup_logging(self):
         """로깅 설정"""
@@ -75,7 +207,15 @@ class TicketingApp(QMainWindow):
         concert_label = QLabel('공연 선택:')
         layout.addWidget(concert_label)
         
+        self.concert_search = QLineEdit()
+        self.concert_search.setPlaceholderText('공연 제목 검색')
+        layout.addWidget(self.concert_search)
+        
+        self.concert_model = ConcertListModel(self)
+        self.concert_search.textChanged.connect(self.filter_concerts)
+        
         self.concert_combo = QComboBox()
+        self.concert_combo.setModel(self.concert_model)
         self.concert_combo.currentIndexChanged.connect(self.concert_selected)
         layout.addWidget(self.concert_combo)
 
@@ -86,6 +226,22 @@ class TicketingApp(QMainWindow):
         self.seat_combo = QComboBox()
         layout.addWidget(self.seat_combo)
 
+        # 수집한 좌석 가격 통계
+        stats_layout = QHBoxLayout()
+        stats_layout.addWidget(QLabel('가격 통계:'))
+        self.stats_combo = QComboBox()
+        self.stats_combo.addItem('좌석 등급별', 'grade')
+        self.stats_combo.addItem('공연장별', 'venue')
+        self.stats_combo.addItem('날짜별', 'date')
+        self.stats_combo.currentIndexChanged.connect(self.update_price_stats)
+        stats_layout.addWidget(self.stats_combo)
+        layout.addLayout(stats_layout)
+        
+        self.stats_table = QTableWidget(0, 5)
+        self.stats_table.setHorizontalHeaderLabels(['구분', '건수', '최저가', '중간값', '최고가'])
+        self.stats_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.stats_table)
+
         # 로그 표시 영역
         self.log_display = QTextEdit()
         self.log_display.setReadOnly(True)
@@ -121,19 +277,17 @@ class TicketingApp(QMainWindow):
             response = requests.get(url, headers=headers)
             response.raise_for_status()
             
-            # BeautifulSoup으로 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 공연 목록 찾기 (실제 HTML 구조에 맞게 선택자 수정)
-            concert_list = soup.select('.Rk_gen2')
+            # 공연 목록 영역만 파싱 (실제 HTML 구조에 맞게 선택자 수정)
+            concert_list = select_regions(response.content, class_='Rk_gen2',
+                                          encoding=resolve_encoding(response))
             
-            self.concert_combo.clear()
-            self.concert_data.clear()
+            self.concert_model.clear()
+            batch = []
             
             for concert in concert_list:
                 try:
                     # 공연 제목과 링크 추출
-                    title_elem = concert.select_one('.RKthumb > a')
+                    title_elem = CONCERT_TITLE_SELECTOR.select_one(concert)
                     if title_elem:
                         title = title_elem.get('title', '').strip()
                         href = title_elem.get('href', '')
@@ -143,18 +297,29 @@ class TicketingApp(QMainWindow):
                             code = href.split('GoodsCode=')[1].split('&')[0]
                             
                             if title and code:
-                                self.concert_data[title] = {
+                                place_elem = CONCERT_PLACE_SELECTOR.select_one(concert)
+                                batch.append({
+                                    'title': title,
                                     'code': code,
+                                    'venue': place_elem.text.strip() if place_elem else '',
                                     'seats': self.fetch_seat_grades(code)
-                                }
-                                self.concert_combo.addItem(title)
-                                self.log_display.append(f"공연 추가: {title}")
+                                })
+                                if len(batch) >= CONCERT_BATCH_SIZE:
+                                    self.add_concert_batch(batch, date_str)
+                                    batch = []
                                 
                 except Exception as e:
                     self.logger.error(f"개별 공연 정보 파싱 실패: {str(e)}")
                     continue
+            
+            self.add_concert_batch(batch, date_str)
+            try:
+                self.price_store.save(PRICE_STORE_PATH)
+            except OSError as e:
+                self.logger.error(f"가격 데이터 저장 실패: {str(e)}")
+            self.update_price_stats()
 
-            if not self.concert_data:
+            if not self.concert_model.concerts:
                 self.log_display.append("해당 날짜에 등록된 공연이 없거나 정보를 가져오지 못했습니다.")
             else:
                 self.log_display.append(f"{date_str} 날짜의 공연 정보를 불러왔습니다.")
@@ -163,6 +328,40 @@ class TicketingApp(QMainWindow):
             self.log_display.append(f"공연 정보 로딩 실패: {str(e)}")
             self.logger.error(f"공연 정보 로딩 실패: {str(e)}")
 
+    def add_concert_batch(self, batch, date_str):
+        """모아둔 공연 정보를 목록과 가격 데이터에 한 번에 추가"""
+        if not batch:
+            return
+        code = self.concert_combo.currentData()
+        self.concert_model.add_concerts(batch)
+        self.restore_concert_selection(code)
+        for concert in batch:
+            self.price_store.add_concert(date_str, concert['code'], concert['seats'],
+                                         concert['venue'])
+        self.log_display.append('\n'.join(f"공연 추가: {concert['title']}" for concert in batch))
+
+    def load_price_store(self):
+        """저장된 가격 데이터 불러오기 (파일이 손상되었으면 빈 데이터로 시작)"""
+        try:
+            self.price_store.load(PRICE_STORE_PATH)
+        except Exception as e:
+            self.logger.error(f"가격 데이터 불러오기 실패: {str(e)}")
+            self.price_store = SeatPriceStore()
+
+    def update_price_stats(self):
+        """수집한 모든 날짜/공연의 좌석 가격 통계 표시"""
+        summary = self.price_store.summary(self.stats_combo.currentData())
+        keys = summary['key'].astype(str)
+        
+        self.stats_table.setRowCount(len(keys))
+        for row, key in enumerate(keys):
+            values = [key, f"{summary['count'][row]}",
+                      f"{summary['min'][row]:,.0f}",
+                      f"{summary['median'][row]:,.0f}",
+                      f"{summary['max'][row]:,.0f}"]
+            for column, value in enumerate(values):
+                self.stats_table.setItem(row, column, QTableWidgetItem(value))
+
     def fetch_seat_grades(self, concert_code):
         """공연의 좌석 등급 정보 가져오기"""
         try:
@@ -177,15 +376,15 @@ class TicketingApp(QMainWindow):
             response = requests.get(url, headers=headers)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
             seats = {}
             
-            # 좌석 등급 정보 추출
-            seat_info = soup.select('.SeatDetail')
+            # 좌석 등급 영역만 파싱해서 정보 추출
+            seat_info = select_regions(response.content, class_='SeatDetail',
+                                       encoding=resolve_encoding(response))
             for seat in seat_info:
                 try:
-                    grade = seat.select_one('.GradeType').text.strip()
-                    price = seat.select_one('.Price').text.strip()
+                    grade = SEAT_GRADE_SELECTOR.select_one(seat).text.strip()
+                    price = SEAT_PRICE_SELECTOR.select_one(seat).text.strip()
                     if grade and price:
                         seats[grade] = price
                 except Exception as e:
@@ -200,12 +399,27 @@ class TicketingApp(QMainWindow):
 
     def concert_selected(self):
         """콘서트 선택 시 좌석 등급 업데이트"""
-        current_concert = self.concert_combo.currentText()
-        if current_concert in self.concert_data:
-            self.seat_combo.clear()
-            for grade in self.concert_data[current_concert]['seats'].keys():
+        self.seat_combo.clear()
+        concert = self.concert_model.concerts.get(self.concert_combo.currentData())
+        if concert:
+            for grade in concert['seats'].keys():
                 self.seat_combo.addItem(grade)
 
+    def filter_concerts(self, text):
+        """검색어로 공연 목록을 거르고 선택 상태 유지"""
+        code = self.concert_combo.currentData()
+        self.concert_model.set_filter(text)
+        self.restore_concert_selection(code)
+
+    def restore_concert_selection(self, code):
+        """모델 갱신 후 이전에 선택한 공연(없으면 첫 번째 공연)을 다시 선택"""
+        row = self.concert_model.row_of(code)
+        if row is None:
+            row = 0 if self.concert_model.rowCount() else -1
+        self.concert_combo.setCurrentIndex(row)
+        # 행 번호가 같아 신호가 오지 않는 경우에도 좌석 등급을 맞춰준다
+        self.concert_selected()
+
     def start_ticketing(self):
         """티켓팅 시작"""
         if not self.validate_inputs():
@@ -240,8 +454,7 @@ class TicketingApp(QMainWindow):
             login_btn.click()
             
             # 선택된 공연 정보로 이동
-            current_concert = self.concert_combo.currentText()
-            concert_code = self.concert_data[current_concert]['code']
+            concert_code = self.concert_combo.currentData()
             
             url = f'http://ticket.interpark.com/Ticket/Goods/GoodsInfo.asp?GoodsCode={concert_code}'
             driver.get(url)